@@ -115,9 +115,8 @@ class BasePulsar(object):
         """Sort data by time."""
         if self._sort:
             self._isort = np.argsort(self._toas, kind="mergesort")
-            self._iisort = np.zeros(len(self._isort), dtype=int)
-            for ii, p in enumerate(self._isort):
-                self._iisort[p] = ii
+            self._iisort = np.empty(len(self._isort), dtype=int)
+            self._iisort[self._isort] = np.arange(len(self._isort))
         else:
             self._isort = slice(None, None, None)
             self._iisort = slice(None, None, None)
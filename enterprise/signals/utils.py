@@ -744,23 +744,32 @@ def bwm_delay(toas, pos, log10_h=-14.0, cos_gwtheta=0.0, gwphi=0.0, gwpol=0.0, t
 def create_quantization_matrix(toas, dt=1, nmin=2):
     """Create quantization matrix mapping TOAs to observing epochs."""
     isort = np.argsort(toas)
-
-    bucket_ref = [toas[isort[0]]]
-    bucket_ind = [[isort[0]]]
-
-    for i in isort[1:]:
-        if toas[i] - bucket_ref[-1] < dt:
-            bucket_ind[-1].append(i)
-        else:
-            bucket_ref.append(toas[i])
-            bucket_ind.append([i])
+    stoas = toas[isort]
+
+    # a gap of at least dt between consecutive TOAs always starts a new epoch
+    bounds = np.concatenate(([0], np.flatnonzero(np.diff(stoas) >= dt) + 1, [len(toas)]))
+
+    # runs of TOAs spanning dt or more are split sequentially, starting
+    # a new epoch at the first TOA at least dt after the current epoch start
+    splits = []
+    spanning = (np.diff(bounds) > 1) & (stoas[bounds[1:] - 1] - stoas[bounds[:-1]] >= dt)
+    for lo, hi in zip(bounds[:-1][spanning], bounds[1:][spanning]):
+        ref = stoas[lo]
+        for i in range(lo + 1, hi):
+            if stoas[i] - ref >= dt:
+                splits.append(i)
+                ref = stoas[i]
+    if splits:
+        bounds = np.sort(np.concatenate((bounds, splits)))
 
     # find only epochs with more than 1 TOA
-    bucket_ind2 = [ind for ind in bucket_ind if len(ind) >= nmin]
+    counts = np.diff(bounds)
+    keep = counts >= nmin
+    epoch = np.repeat(np.cumsum(keep) - 1, counts)
+    inepoch = np.repeat(keep, counts)
 
-    U = np.zeros((len(toas), len(bucket_ind2)), "d")
-    for i, l in enumerate(bucket_ind2):
-        U[l, i] = 1
+    U = np.zeros((len(toas), np.count_nonzero(keep)), "d")
+    U[isort[inepoch], epoch[inepoch]] = 1
 
     weights = np.ones(U.shape[1])
 
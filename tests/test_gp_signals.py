@@ -42,6 +42,29 @@ class TestGPSignals(unittest.TestCase):
 
         # initialize Pulsar class
         cls.psr = Pulsar(datadir + "/B1855+09_NANOGrav_9yv1.gls.par", datadir + "/B1855+09_NANOGrav_9yv1.tim")
+        cls._setup_references()
+
+    @classmethod
+    def _setup_references(cls):
+        """Compute reference bases shared by several tests."""
+
+        cls._U = utils.create_quantization_matrix(cls.psr.toas)[0]
+        cls._F30, cls._f30 = utils.createfourierdesignmatrix_red(cls.psr.toas, nmodes=30)
+        cls._Uweek, cls._avetoas_week = create_quant_matrix(cls.psr.toas, dt=7 * 86400)
+
+        # backend groups, in the sorted order used by selections.by_backend
+        backends, inv = np.unique(cls.psr.backend_flags, return_inverse=True)
+        cls._backend_masks = [inv == ct for ct in range(len(backends))]
+        cls._backend_order = np.argsort(inv, kind="stable")
+
+        cls._Ntoas = len(cls.psr.toas)
+        cls._Mncols = cls.psr.Mmat.shape[1]
+
+        Mmat = cls.psr.Mmat
+        cls._Mnorm = Mmat / np.linalg.norm(Mmat, axis=0)
+
+        # toas are returned sorted, so the span is just last minus first
+        cls._Tmax = float(cls.psr.toas[-1] - cls.psr.toas[0])
 
     def test_ecorr(self):
         """Test that ecorr signal returns correct values."""
@@ -54,23 +77,29 @@ class TestGPSignals(unittest.TestCase):
         ecorr = -6.4
         params = {"B1855+09_basis_ecorr_log10_ecorr": ecorr}
 
+        # evaluate the signal model once
+        mbasis = ecm.get_basis(params)
+        mphi = ecm.get_phi(params)
+        mphiinv = ecm.get_phiinv(params)
+
         # basis matrix test
-        U = utils.create_quantization_matrix(self.psr.toas)[0]
+        U = self._U
         msg = "U matrix incorrect for Basis Ecorr signal."
-        assert np.allclose(U, ecm.get_basis(params)), msg
+        assert np.allclose(U, mbasis), msg
 
         # Jvec test
-        jvec = 10 ** (2 * ecorr) * np.ones(U.shape[1])
+        jvec = np.full(U.shape[1], 10 ** (2 * ecorr))
         msg = "Prior vector incorrect for Basis Ecorr signal."
-        assert np.all(ecm.get_phi(params) == jvec), msg
+        assert np.array_equal(mphi, jvec), msg
 
         # inverse Jvec test
+        jvecinv = 1 / jvec
         msg = "Prior vector inverse incorrect for Basis Ecorr signal."
-        assert np.all(ecm.get_phiinv(params) == 1 / jvec), msg
+        assert np.array_equal(mphiinv, jvecinv), msg
 
         # test shape
         msg = "U matrix shape incorrect"
-        assert ecm.get_basis(params).shape == U.shape, msg
+        assert mbasis.shape == U.shape, msg
 
     def test_ecorr_backend(self):
         """Test that ecorr-backend signal returns correct values."""
@@ -89,38 +118,40 @@ class TestGPSignals(unittest.TestCase):
             "B1855+09_basis_ecorr_L-wide_PUPPI_log10_ecorr": ecorrs[3],
         }
 
+        # evaluate the signal model once
+        mbasis = ecm.get_basis(params)
+        mphi = ecm.get_phi(params)
+        mphiinv = ecm.get_phiinv(params)
+
         # get the basis
-        bflags = self.psr.backend_flags
+        masks, order = self._backend_masks, self._backend_order
         Umats = []
-        for flag in np.unique(bflags):
-            mask = bflags == flag
-            Umats.append(utils.create_quantization_matrix(self.psr.toas[mask])[0])
-        nepoch = sum(U.shape[1] for U in Umats)
-        U = np.zeros((len(self.psr.toas), nepoch))
-        jvec = np.zeros(nepoch)
-        netot = 0
-        for ct, flag in enumerate(np.unique(bflags)):
-            mask = bflags == flag
-            nn = Umats[ct].shape[1]
-            U[mask, netot : nn + netot] = Umats[ct]
-            jvec[netot : nn + netot] = 10 ** (2 * ecorrs[ct])
-            netot += nn
+        for ct in range(len(masks)):
+            Umats.append(utils.create_quantization_matrix(self.psr.toas[masks[ct]])[0])
+        offsets = np.cumsum([0] + [U.shape[1] for U in Umats])
+        # fill contiguous per-backend row blocks, then restore TOA order
+        U = np.empty((self._Ntoas, offsets[-1]))
+        U[order] = sl.block_diag(*Umats)
+        jvec = np.zeros(offsets[-1])
+        for ct in range(len(Umats)):
+            jvec[offsets[ct] : offsets[ct + 1]] = 10 ** (2 * ecorrs[ct])
 
         # basis matrix test
         msg = "U matrix incorrect for Basis Ecorr-backend signal."
-        assert np.allclose(U, ecm.get_basis(params)), msg
+        assert np.allclose(U, mbasis), msg
 
         # Jvec test
         msg = "Prior vector incorrect for Basis Ecorr backend signal."
-        assert np.all(ecm.get_phi(params) == jvec), msg
+        assert np.array_equal(mphi, jvec), msg
 
         # inverse Jvec test
+        jvecinv = 1 / jvec
         msg = "Prior vector inverse incorrect for Basis Ecorr backend signal."
-        assert np.all(ecm.get_phiinv(params) == 1 / jvec), msg
+        assert np.array_equal(mphiinv, jvecinv), msg
 
         # test shape
         msg = "U matrix shape incorrect"
-        assert ecm.get_basis(params).shape == U.shape, msg
+        assert mbasis.shape == U.shape, msg
 
     def test_kernel(self):
 
@@ -136,20 +167,25 @@ class TestGPSignals(unittest.TestCase):
         log10_lam, log10_sigma = 7.4, -6.4
         params = {"B1855+09_se_log10_lam": log10_lam, "B1855+09_se_log10_sigma": log10_sigma}
 
+        # evaluate the signal model once
+        mbasis = sem.get_basis(params)
+        mphi = sem.get_phi(params)
+        mphiinv = sem.get_phiinv(params)
+
         # basis check
-        U, avetoas = create_quant_matrix(self.psr.toas, dt=7 * 86400)
+        U, avetoas = self._Uweek, self._avetoas_week
         msg = "Kernel Basis incorrect"
-        assert np.allclose(U, sem.get_basis(params)), msg
+        assert np.allclose(U, mbasis), msg
 
         # kernel test
         K = se_kernel(avetoas, log10_lam=log10_lam, log10_sigma=log10_sigma)
         msg = "Kernel incorrect"
-        assert np.allclose(K, sem.get_phi(params)), msg
+        assert np.allclose(K, mphi), msg
 
         # inverse kernel test
         Kinv = np.linalg.inv(K)
         msg = "Kernel inverse incorrect"
-        assert np.allclose(Kinv, sem.get_phiinv(params)), msg
+        assert np.allclose(Kinv, mphiinv), msg
 
     def test_kernel_backend(self):
         # set up signal parameter
@@ -176,37 +212,37 @@ class TestGPSignals(unittest.TestCase):
             "B1855+09_se_L-wide_PUPPI_log10_sigma": log10_sigmas[3],
         }
 
+        # evaluate the signal model once
+        mbasis = sem.get_basis(params)
+        mphi = sem.get_phi(params)
+        mphiinv = sem.get_phiinv(params)
+
         # get the basis
-        bflags = self.psr.backend_flags
+        masks, order = self._backend_masks, self._backend_order
         Fmats, fs, phis = [], [], []
-        for ct, flag in enumerate(np.unique(bflags)):
-            mask = bflags == flag
-            U, avetoas = create_quant_matrix(self.psr.toas[mask], dt=7 * 86400)
+        for ct in range(len(masks)):
+            U, avetoas = create_quant_matrix(self.psr.toas[masks[ct]], dt=7 * 86400)
             Fmats.append(U)
             fs.append(avetoas)
             phis.append(se_kernel(avetoas, log10_sigma=log10_sigmas[ct], log10_lam=log10_lams[ct]))
 
         nf = sum(F.shape[1] for F in Fmats)
-        U = np.zeros((len(self.psr.toas), nf))
+        # fill contiguous per-backend row blocks, then restore TOA order
+        U = np.empty((self._Ntoas, nf))
+        U[order] = sl.block_diag(*Fmats)
         K = sl.block_diag(*phis)
         Kinv = np.linalg.inv(K)
-        nftot = 0
-        for ct, flag in enumerate(np.unique(bflags)):
-            mask = bflags == flag
-            nn = Fmats[ct].shape[1]
-            U[mask, nftot : nn + nftot] = Fmats[ct]
-            nftot += nn
 
         msg = "Kernel basis incorrect for backend signal."
-        assert np.allclose(U, sem.get_basis(params)), msg
+        assert np.allclose(U, mbasis), msg
 
         # spectrum test
         msg = "Kernel incorrect for backend signal."
-        assert np.allclose(sem.get_phi(params), K), msg
+        assert np.allclose(mphi, K), msg
 
         # inverse spectrum test
         msg = "Kernel inverse incorrect for backend signal."
-        assert np.allclose(sem.get_phiinv(params), Kinv), msg
+        assert np.allclose(mphiinv, Kinv), msg
 
     def test_fourier_red_noise(self):
         """Test that red noise signal returns correct values."""
@@ -219,23 +255,29 @@ class TestGPSignals(unittest.TestCase):
         log10_A, gamma = -14.5, 4.33
         params = {"B1855+09_red_noise_log10_A": log10_A, "B1855+09_red_noise_gamma": gamma}
 
+        # evaluate the signal model once
+        mbasis = rnm.get_basis(params)
+        mphi = rnm.get_phi(params)
+        mphiinv = rnm.get_phiinv(params)
+
         # basis matrix test
-        F, f2 = utils.createfourierdesignmatrix_red(self.psr.toas, nmodes=30)
+        F, f2 = self._F30, self._f30
         msg = "F matrix incorrect for GP Fourier signal."
-        assert np.allclose(F, rnm.get_basis(params)), msg
+        assert np.allclose(F, mbasis), msg
 
         # spectrum test
         phi = utils.powerlaw(f2, log10_A=log10_A, gamma=gamma)
         msg = "Spectrum incorrect for GP Fourier signal."
-        assert np.all(rnm.get_phi(params) == phi), msg
+        assert np.array_equal(mphi, phi), msg
 
         # inverse spectrum test
+        phiinv = 1 / phi
         msg = "Spectrum inverse incorrect for GP Fourier signal."
-        assert np.all(rnm.get_phiinv(params) == 1 / phi), msg
+        assert np.array_equal(mphiinv, phiinv), msg
 
         # test shape
         msg = "F matrix shape incorrect"
-        assert rnm.get_basis(params).shape == F.shape, msg
+        assert mbasis.shape == F.shape, msg
 
     def test_fourier_red_noise_pshift(self):
         """Test that red noise signal returns correct values."""
@@ -248,23 +290,29 @@ class TestGPSignals(unittest.TestCase):
         log10_A, gamma = -14.5, 4.33
         params = {"B1855+09_red_noise_log10_A": log10_A, "B1855+09_red_noise_gamma": gamma}
 
+        # evaluate the signal model once
+        mbasis = rnm.get_basis(params)
+        mphi = rnm.get_phi(params)
+        mphiinv = rnm.get_phiinv(params)
+
         # basis matrix test
         F, f2 = utils.createfourierdesignmatrix_red(self.psr.toas, nmodes=30, pshift=True, pseed=42)
         msg = "F matrix incorrect for GP Fourier signal."
-        assert np.allclose(F, rnm.get_basis(params)), msg
+        assert np.allclose(F, mbasis), msg
 
         # spectrum test
         phi = utils.powerlaw(f2, log10_A=log10_A, gamma=gamma)
         msg = "Spectrum incorrect for GP Fourier signal."
-        assert np.all(rnm.get_phi(params) == phi), msg
+        assert np.array_equal(mphi, phi), msg
 
         # inverse spectrum test
+        phiinv = 1 / phi
         msg = "Spectrum inverse incorrect for GP Fourier signal."
-        assert np.all(rnm.get_phiinv(params) == 1 / phi), msg
+        assert np.array_equal(mphiinv, phiinv), msg
 
         # test shape
         msg = "F matrix shape incorrect"
-        assert rnm.get_basis(params).shape == F.shape, msg
+        assert mbasis.shape == F.shape, msg
 
     def test_fourier_red_user_freq_array(self):
         """Test that red noise signal returns correct values with user defined
@@ -273,29 +321,35 @@ class TestGPSignals(unittest.TestCase):
         log10_A, gamma = -14.5, 4.33
         params = {"B1855+09_red_noise_log10_A": log10_A, "B1855+09_red_noise_gamma": gamma}
 
-        F, f2 = utils.createfourierdesignmatrix_red(self.psr.toas, nmodes=30)
+        F, f2 = self._F30, self._f30
 
         # set up signal model. use list of frequencies to make basis
         pl = utils.powerlaw(log10_A=parameter.Uniform(-18, -12), gamma=parameter.Uniform(1, 7))
         rn = gp_signals.FourierBasisGP(spectrum=pl, modes=f2[::2])
         rnm = rn(self.psr)
 
+        # evaluate the signal model once
+        mbasis = rnm.get_basis(params)
+        mphi = rnm.get_phi(params)
+        mphiinv = rnm.get_phiinv(params)
+
         # basis matrix test
         msg = "F matrix incorrect for GP Fourier signal."
-        assert np.allclose(F, rnm.get_basis(params)), msg
+        assert np.allclose(F, mbasis), msg
 
         # spectrum test
         phi = utils.powerlaw(f2, log10_A=log10_A, gamma=gamma)
         msg = "Spectrum incorrect for GP Fourier signal."
-        assert np.all(rnm.get_phi(params) == phi), msg
+        assert np.array_equal(mphi, phi), msg
 
         # inverse spectrum test
+        phiinv = 1 / phi
         msg = "Spectrum inverse incorrect for GP Fourier signal."
-        assert np.all(rnm.get_phiinv(params) == 1 / phi), msg
+        assert np.array_equal(mphiinv, phiinv), msg
 
         # test shape
         msg = "F matrix shape incorrect"
-        assert rnm.get_basis(params).shape == F.shape, msg
+        assert mbasis.shape == F.shape, msg
 
     def test_fourier_red_noise_backend(self):
         """Test that red noise-backend signal returns correct values."""
@@ -319,40 +373,41 @@ class TestGPSignals(unittest.TestCase):
             "B1855+09_red_noise_L-wide_PUPPI_log10_A": log10_As[3],
         }
 
+        # evaluate the signal model once
+        mbasis = rnm.get_basis(params)
+        mphi = rnm.get_phi(params)
+        mphiinv = rnm.get_phiinv(params)
+
         # get the basis
-        bflags = self.psr.backend_flags
+        masks, order = self._backend_masks, self._backend_order
         Fmats, fs, phis = [], [], []
-        for ct, flag in enumerate(np.unique(bflags)):
-            mask = bflags == flag
-            F, f = utils.createfourierdesignmatrix_red(self.psr.toas[mask], 30)
+        for ct in range(len(masks)):
+            F, f = utils.createfourierdesignmatrix_red(self.psr.toas[masks[ct]], 30)
             Fmats.append(F)
             fs.append(f)
             phis.append(utils.powerlaw(f, log10_As[ct], gammas[ct]))
 
         nf = sum(F.shape[1] for F in Fmats)
-        F = np.zeros((len(self.psr.toas), nf))
-        phi = np.hstack([p for p in phis])
-        nftot = 0
-        for ct, flag in enumerate(np.unique(bflags)):
-            mask = bflags == flag
-            nn = Fmats[ct].shape[1]
-            F[mask, nftot : nn + nftot] = Fmats[ct]
-            nftot += nn
+        # fill contiguous per-backend row blocks, then restore TOA order
+        F = np.empty((self._Ntoas, nf))
+        F[order] = sl.block_diag(*Fmats)
+        phi = np.concatenate(phis)
 
         msg = "F matrix incorrect for GP Fourier backend signal."
-        assert np.allclose(F, rnm.get_basis(params)), msg
+        assert np.allclose(F, mbasis), msg
 
         # spectrum test
         msg = "Spectrum incorrect for GP Fourier backend signal."
-        assert np.all(rnm.get_phi(params) == phi), msg
+        assert np.array_equal(mphi, phi), msg
 
         # inverse spectrum test
+        phiinv = 1 / phi
         msg = "Spectrum inverse incorrect for GP Fourier backend signal."
-        assert np.all(rnm.get_phiinv(params) == 1 / phi), msg
+        assert np.array_equal(mphiinv, phiinv), msg
 
         # test shape
         msg = "F matrix shape incorrect"
-        assert rnm.get_basis(params).shape == F.shape, msg
+        assert mbasis.shape == F.shape, msg
 
     def test_red_noise_add(self):
         """Test that red noise addition only returns independent columns."""
@@ -372,7 +427,7 @@ class TestGPSignals(unittest.TestCase):
             "gamma_gw": gammac,
         }
 
-        Tmax = self.psr.toas.max() - self.psr.toas.min()
+        Tmax = self._Tmax
         tpars = [
             (30, 20, Tmax, Tmax),
             (20, 30, Tmax, Tmax),
@@ -382,44 +437,52 @@ class TestGPSignals(unittest.TestCase):
             (30, 30, 1.123 * Tmax, Tmax),
         ]
 
-        for (nf1, nf2, T1, T2) in tpars:
+        # Fourier bases for each distinct (nmodes, Tspan) pair
+        Fcache = {}
+        for nf, T in {(nf1, T1) for nf1, _, T1, _ in tpars} | {(nf2, T2) for _, nf2, _, T2 in tpars}:
+            Fcache[nf, T] = utils.createfourierdesignmatrix_red(self.psr.toas, nmodes=nf, Tspan=T)
 
-            rn = gp_signals.FourierBasisGP(spectrum=pl, components=nf1, Tspan=T1)
-            crn = gp_signals.FourierBasisGP(spectrum=cpl, components=nf2, Tspan=T2)
-            s = rn + crn
-            rnm = s(self.psr)
-
-            # set up frequencies
-            F1, f1 = utils.createfourierdesignmatrix_red(self.psr.toas, nmodes=nf1, Tspan=T1)
-            F2, f2 = utils.createfourierdesignmatrix_red(self.psr.toas, nmodes=nf2, Tspan=T2)
-
-            # test power spectrum
-            p1 = utils.powerlaw(f1, log10_A, gamma)
-            p2 = utils.powerlaw(f2, log10_Ac, gammac)
-            if T1 == T2:
-                nf = max(2 * nf1, 2 * nf2)
-                phi = np.zeros(nf)
-                F = F1 if nf1 > nf2 else F2
-                phi[: 2 * nf1] = p1
-                phi[: 2 * nf2] += p2
-                F[
-                    :,
-                ]  # noqa: E231
-            else:
-                phi = np.concatenate((p1, p2))
-                F = np.hstack((F1, F2))
-
-            msg = "Combined red noise PSD incorrect "
-            msg += "for {} {} {} {}".format(nf1, nf2, T1, T2)
-            assert np.all(rnm.get_phi(params) == phi), msg
-
-            msg = "Combined red noise PSD inverse incorrect "
-            msg += "for {} {} {} {}".format(nf1, nf2, T1, T2)
-            assert np.all(rnm.get_phiinv(params) == 1 / phi), msg
-
-            msg = "Combined red noise Fmat incorrect "
-            msg += "for {} {} {} {}".format(nf1, nf2, T1, T2)
-            assert np.allclose(F, rnm.get_basis(params)), msg
+        for (nf1, nf2, T1, T2) in tpars:
+            with self.subTest(nf1=nf1, nf2=nf2, T1=T1, T2=T2):
+                rn = gp_signals.FourierBasisGP(spectrum=pl, components=nf1, Tspan=T1)
+                crn = gp_signals.FourierBasisGP(spectrum=cpl, components=nf2, Tspan=T2)
+                s = rn + crn
+                rnm = s(self.psr)
+
+                # evaluate the signal model once
+                mbasis = rnm.get_basis(params)
+                mphi = rnm.get_phi(params)
+                mphiinv = rnm.get_phiinv(params)
+
+                # set up frequencies
+                F1, f1 = Fcache[nf1, T1]
+                F2, f2 = Fcache[nf2, T2]
+
+                # test power spectrum
+                p1 = utils.powerlaw(f1, log10_A, gamma)
+                p2 = utils.powerlaw(f2, log10_Ac, gammac)
+                if T1 == T2:
+                    nf = max(2 * nf1, 2 * nf2)
+                    phi = np.zeros(nf)
+                    F = F1 if nf1 > nf2 else F2
+                    phi[: 2 * nf1] = p1
+                    phi[: 2 * nf2] += p2
+                else:
+                    phi = np.concatenate((p1, p2))
+                    F = np.hstack((F1, F2))
+
+                msg = "Combined red noise PSD incorrect "
+                msg += "for {} {} {} {}".format(nf1, nf2, T1, T2)
+                assert np.array_equal(mphi, phi), msg
+
+                phiinv = 1 / phi
+                msg = "Combined red noise PSD inverse incorrect "
+                msg += "for {} {} {} {}".format(nf1, nf2, T1, T2)
+                assert np.array_equal(mphiinv, phiinv), msg
+
+                msg = "Combined red noise Fmat incorrect "
+                msg += "for {} {} {} {}".format(nf1, nf2, T1, T2)
+                assert np.allclose(F, mbasis), msg
 
     def test_red_noise_add_backend(self):
         """Test that red noise with backend addition only returns
@@ -448,7 +511,7 @@ class TestGPSignals(unittest.TestCase):
             "gamma_gw": gammac,
         }
 
-        Tmax = self.psr.toas.max() - self.psr.toas.min()
+        Tmax = self._Tmax
         tpars = [
             (30, 20, Tmax, Tmax),
             (20, 30, Tmax, Tmax),
@@ -459,49 +522,60 @@ class TestGPSignals(unittest.TestCase):
             (30, 20, None, Tmax),
         ]
 
-        for (nf1, nf2, T1, T2) in tpars:
+        masks, order = self._backend_masks, self._backend_order
+
+        # common-process bases for each distinct (nmodes, Tspan) pair,
+        # and per-backend bases for each distinct (backend, nmodes, Tspan)
+        Fcache, Fcache_b = {}, {}
+        for nf1, nf2, T1, T2 in tpars:
+            if (nf2, T2) not in Fcache:
+                Fcache[nf2, T2] = utils.createfourierdesignmatrix_red(self.psr.toas, nf2, Tspan=T2)
+            for ct, mask in enumerate(masks):
+                if (ct, nf1, T1) not in Fcache_b:
+                    Fcache_b[ct, nf1, T1] = utils.createfourierdesignmatrix_red(self.psr.toas[mask], nf1, Tspan=T1)
 
-            rn = gp_signals.FourierBasisGP(spectrum=pl, components=nf1, Tspan=T1, selection=selection)
-            crn = gp_signals.FourierBasisGP(spectrum=cpl, components=nf2, Tspan=T2)
-            s = rn + crn
-            rnm = s(self.psr)
-
-            # get the basis
-            bflags = self.psr.backend_flags
-            Fmats, fs, phis = [], [], []
-            F2, f2 = utils.createfourierdesignmatrix_red(self.psr.toas, nf2, Tspan=T2)
-            p2 = utils.powerlaw(f2, log10_Ac, gammac)
-            for ct, flag in enumerate(np.unique(bflags)):
-                mask = bflags == flag
-                F1, f1 = utils.createfourierdesignmatrix_red(self.psr.toas[mask], nf1, Tspan=T1)
-                Fmats.append(F1)
-                fs.append(f1)
-                phis.append(utils.powerlaw(f1, log10_As[ct], gammas[ct]))
-
-            Fmats.append(F2)
-            phis.append(p2)
-            nf = sum(F.shape[1] for F in Fmats)
-            F = np.zeros((len(self.psr.toas), nf))
-            phi = np.hstack([p for p in phis])
-            nftot = 0
-            for ct, flag in enumerate(np.unique(bflags)):
-                mask = bflags == flag
-                nn = Fmats[ct].shape[1]
-                F[mask, nftot : nn + nftot] = Fmats[ct]
-                nftot += nn
-            F[:, -2 * nf2 :] = F2
-
-            msg = "Combined red noise PSD incorrect "
-            msg += "for {} {} {} {}".format(nf1, nf2, T1, T2)
-            assert np.all(rnm.get_phi(params) == phi), msg
-
-            msg = "Combined red noise PSD inverse incorrect "
-            msg += "for {} {} {} {}".format(nf1, nf2, T1, T2)
-            assert np.all(rnm.get_phiinv(params) == 1 / phi), msg
-
-            msg = "Combined red noise Fmat incorrect "
-            msg += "for {} {} {} {}".format(nf1, nf2, T1, T2)
-            assert np.allclose(F, rnm.get_basis(params)), msg
+        for (nf1, nf2, T1, T2) in tpars:
+            with self.subTest(nf1=nf1, nf2=nf2, T1=T1, T2=T2):
+                rn = gp_signals.FourierBasisGP(spectrum=pl, components=nf1, Tspan=T1, selection=selection)
+                crn = gp_signals.FourierBasisGP(spectrum=cpl, components=nf2, Tspan=T2)
+                s = rn + crn
+                rnm = s(self.psr)
+
+                # evaluate the signal model once
+                mbasis = rnm.get_basis(params)
+                mphi = rnm.get_phi(params)
+                mphiinv = rnm.get_phiinv(params)
+
+                # get the basis
+                Fmats, fs, phis = [], [], []
+                F2, f2 = Fcache[nf2, T2]
+                p2 = utils.powerlaw(f2, log10_Ac, gammac)
+                for ct in range(len(masks)):
+                    F1, f1 = Fcache_b[ct, nf1, T1]
+                    Fmats.append(F1)
+                    fs.append(f1)
+                    phis.append(utils.powerlaw(f1, log10_As[ct], gammas[ct]))
+
+                phis.append(p2)
+                nf = sum(F.shape[1] for F in Fmats)
+                # fill contiguous per-backend row blocks, then restore TOA order
+                F = np.empty((self._Ntoas, nf + F2.shape[1]))
+                F[order, :nf] = sl.block_diag(*Fmats)
+                F[:, nf:] = F2
+                phi = np.concatenate(phis)
+
+                msg = "Combined red noise PSD incorrect "
+                msg += "for {} {} {} {}".format(nf1, nf2, T1, T2)
+                assert np.array_equal(mphi, phi), msg
+
+                phiinv = 1 / phi
+                msg = "Combined red noise PSD inverse incorrect "
+                msg += "for {} {} {} {}".format(nf1, nf2, T1, T2)
+                assert np.array_equal(mphiinv, phiinv), msg
+
+                msg = "Combined red noise Fmat incorrect "
+                msg += "for {} {} {} {}".format(nf1, nf2, T1, T2)
+                assert np.allclose(F, mbasis), msg
 
     def test_gp_timing_model(self):
         """Test that the timing model signal returns correct values."""
@@ -509,26 +583,30 @@ class TestGPSignals(unittest.TestCase):
         ts = gp_signals.TimingModel()
         tm = ts(self.psr)
 
-        # basis matrix test
-        M = self.psr.Mmat.copy()
-        norm = np.sqrt(np.sum(M**2, axis=0))
-        M /= norm
+        # evaluate the signal model once
         params = {}
+        mbasis = tm.get_basis(params)
+        mphi = tm.get_phi(params)
+        mphiinv = tm.get_phiinv(params)
+
+        # basis matrix test
+        M = self._Mnorm
         msg = "M matrix incorrect for Timing Model signal."
-        assert np.allclose(M, tm.get_basis(params)), msg
+        assert np.allclose(M, mbasis), msg
 
         # Jvec test
-        phi = np.ones(self.psr.Mmat.shape[1]) * 1e40
+        phi = np.full(self._Mncols, 1e40)
         msg = "Prior vector incorrect for Timing Model signal."
-        assert np.all(tm.get_phi(params) == phi), msg
+        assert np.array_equal(mphi, phi), msg
 
         # inverse Jvec test
+        phiinv = np.full(self._Mncols, 1e-40)
         msg = "Prior vector inverse incorrect for Timing Model signal."
-        assert np.all(tm.get_phiinv(params) == 1 / phi), msg
+        assert np.array_equal(mphiinv, phiinv), msg
 
         # test shape
         msg = "M matrix shape incorrect"
-        assert tm.get_basis(params).shape == self.psr.Mmat.shape, msg
+        assert mbasis.shape == self.psr.Mmat.shape, msg
 
         # test unnormed
         ts = gp_signals.TimingModel(normed=False)
@@ -538,7 +616,7 @@ class TestGPSignals(unittest.TestCase):
         assert np.allclose(self.psr.Mmat, tm.get_basis({})), msg
 
         # test prescribed norm
-        ts = gp_signals.TimingModel(normed=np.ones(self.psr.Mmat.shape[1]))
+        ts = gp_signals.TimingModel(normed=np.ones(self._Mncols))
         tm = ts(self.psr)
 
         msg = "Incorrect prescribed-norm timing-model matrix"
@@ -560,7 +638,7 @@ class TestGPSignals(unittest.TestCase):
 
         # build a SignalCollection with timing model and red noise with phase shifts
 
-        Tspan = self.psr.toas.max() - self.psr.toas.min()
+        Tspan = self._Tmax
         pl = utils.powerlaw(log10_A=parameter.Uniform(-18, -12), gamma=parameter.Uniform(0, 7))
 
         ts = gp_signals.TimingModel()
@@ -572,22 +650,22 @@ class TestGPSignals(unittest.TestCase):
         b1 = m.signals[1].get_basis()
         b2 = utils.createfourierdesignmatrix_red(nmodes=5, Tspan=Tspan)("")(self.psr.toas)[0]
         msg = "Fourier bases incorrect (no phase shifts)"
-        assert np.all(b1 == b2), msg
+        assert np.array_equal(b1, b2), msg
 
         b1 = m.signals[1].get_basis()
         b2 = utils.createfourierdesignmatrix_red(nmodes=5, Tspan=Tspan, pseed=5)("")(self.psr.toas)[0]
         msg = "Fourier bases incorrect (no-parameter call vs phase shift 5)"
-        assert not np.all(b1 == b2), msg
+        assert not np.array_equal(b1, b2), msg
 
         b1 = m.signals[1].get_basis(params={self.psr.name + "_red_noise_pseed": 5})
         b2 = utils.createfourierdesignmatrix_red(nmodes=5, Tspan=Tspan, pseed=5)("")(self.psr.toas)[0]
         msg = "Fourier bases incorrect (phase shift 5)"
-        assert np.all(b1 == b2), msg
+        assert np.array_equal(b1, b2), msg
 
         b1 = m.signals[1].get_basis(params={self.psr.name + "_red_noise_pseed": 5})
         b2 = utils.createfourierdesignmatrix_red(nmodes=5, Tspan=Tspan)("")(self.psr.toas)[0]
         msg = "Fourier bases incorrect (phase-shift-5 call vs no phase shift)"
-        assert not np.all(b1 == b2), msg
+        assert not np.array_equal(b1, b2), msg
 
     def test_gp_parameter(self):
         """Test GP basis model with parameterized basis."""
@@ -618,8 +696,13 @@ class TestGPSignals(unittest.TestCase):
             "B1855+09_env_t0": t0,
         }
 
+        # evaluate the signal model once
+        mbasis = m.get_basis(params)
+        mphi = m.get_phi(params)
+        mphiinv = m.get_phiinv(params)
+
         # get basis
-        Fred, f2_red = utils.createfourierdesignmatrix_red(self.psr.toas, nmodes=30)
+        Fred, f2_red = self._F30, self._f30
         Fenv, f2_env = utils.createfourierdesignmatrix_env(
             self.psr.toas, nmodes=30, log10_Amp=log10_Amp, log10_Q=log10_Q, t0=t0
         )
@@ -630,19 +713,20 @@ class TestGPSignals(unittest.TestCase):
 
         # basis matrix test
         msg = "F matrix incorrect for GP Fourier signal."
-        assert np.allclose(F, m.get_basis(params)), msg
+        assert np.allclose(F, mbasis), msg
 
         # spectrum test
         msg = "Spectrum incorrect for GP Fourier signal."
-        assert np.all(m.get_phi(params) == phi), msg
+        assert np.array_equal(mphi, phi), msg
 
         # inverse spectrum test
+        phiinv = 1 / phi
         msg = "Spectrum inverse incorrect for GP Fourier signal."
-        assert np.all(m.get_phiinv(params) == 1 / phi), msg
+        assert np.array_equal(mphiinv, phiinv), msg
 
         # test shape
         msg = "F matrix shape incorrect"
-        assert m.get_basis(params).shape == F.shape, msg
+        assert mbasis.shape == F.shape, msg
 
     def test_combine_signals(self):
         """Test for combining different signals."""
@@ -676,18 +760,21 @@ class TestGPSignals(unittest.TestCase):
             "B1855+09_se_log10_sigma": log10_sigma,
         }
 
+        # evaluate the signal model once
+        mbasis = m.get_basis(params)
+        mphi = m.get_phi(params)
+        mphiinv = m.get_phiinv(params)
+
         # combined basis matrix
-        U = utils.create_quantization_matrix(self.psr.toas)[0]
-        M = self.psr.Mmat.copy()
-        norm = np.sqrt(np.sum(M**2, axis=0))
-        M /= norm
-        F, f2 = utils.createfourierdesignmatrix_red(self.psr.toas, nmodes=30)
-        U2, avetoas = create_quant_matrix(self.psr.toas, dt=7 * 86400)
+        U = self._U
+        M = self._Mnorm
+        F, f2 = self._F30, self._f30
+        U2, avetoas = self._Uweek, self._avetoas_week
         T = np.hstack((U, F, M, U2))
 
         # combined prior vector
-        jvec = 10 ** (2 * ecorr) * np.ones(U.shape[1])
-        phim = np.ones(self.psr.Mmat.shape[1]) * 1e40
+        jvec = np.full(U.shape[1], 10 ** (2 * ecorr))
+        phim = np.full(self._Mncols, 1e40)
         phi = utils.powerlaw(f2, log10_A=log10_A, gamma=gamma)
         K = se_kernel(avetoas, log10_lam=log10_lam, log10_sigma=log10_sigma)
         phivec = np.concatenate((jvec, phi, phim))
@@ -696,19 +783,19 @@ class TestGPSignals(unittest.TestCase):
 
         # basis matrix test
         msg = "Basis matrix incorrect for combined signal."
-        assert np.allclose(T, m.get_basis(params)), msg
+        assert np.allclose(T, mbasis), msg
 
         # Kernal test
         msg = "Prior matrix incorrect for combined signal."
-        assert np.allclose(m.get_phi(params), phi), msg
+        assert np.allclose(mphi, phi), msg
 
         # inverse Kernel test
         msg = "Prior matrix inverse incorrect for combined signal."
-        assert np.allclose(m.get_phiinv(params), phiinv), msg
+        assert np.allclose(mphiinv, phiinv), msg
 
         # test shape
         msg = "Basis matrix shape incorrect size for combined signal."
-        assert m.get_basis(params).shape == T.shape, msg
+        assert mbasis.shape == T.shape, msg
 
 
 class TestGPSignalsPint(TestGPSignals):
@@ -723,3 +810,4 @@ class TestGPSignalsPint(TestGPSignals):
             ephem="DE430",
             timing_package="pint",
         )
+        cls._setup_references()
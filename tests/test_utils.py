@@ -128,6 +128,31 @@ class TestUtils(unittest.TestCase):
         assert U.shape == (4005, 235), msg1
         assert all(np.sum(U, axis=0) > 1), msg2
 
+    def test_quantization_matrix_epochs(self):
+        """Test quantization matrix epoch assignment on hand-built TOAs."""
+        # a run spanning more than dt is split sequentially from each epoch start
+        toas = np.array([0, 0.6, 1.2, 1.8, 5])
+        U1 = np.array([[1, 0, 0], [1, 0, 0], [0, 1, 0], [0, 1, 0], [0, 0, 1]], "d")
+
+        msg = "Quantization matrix epochs incorrect for nmin=1."
+        assert np.array_equal(utils.create_quantization_matrix(toas, dt=1, nmin=1)[0], U1), msg
+
+        msg = "Quantization matrix epochs incorrect for nmin=2."
+        assert np.array_equal(utils.create_quantization_matrix(toas, dt=1, nmin=2)[0], U1[:, :2]), msg
+
+        # unsorted input keeps the input row order, with epochs in time order
+        perm = np.array([3, 0, 4, 2, 1])
+        msg = "Quantization matrix epochs incorrect for unsorted TOAs."
+        assert np.array_equal(utils.create_quantization_matrix(toas[perm], dt=1, nmin=1)[0], U1[perm]), msg
+
+        # a TOA exactly dt after the epoch start begins a new epoch
+        toas = np.array([0, 1, 1, 2])
+        U2 = np.array([[1, 0, 0], [0, 1, 0], [0, 1, 0], [0, 0, 1]], "d")
+
+        msg = "Quantization matrix epochs incorrect for ties at dt."
+        assert np.array_equal(utils.create_quantization_matrix(toas, dt=1, nmin=1)[0], U2), msg
+        assert np.array_equal(utils.create_quantization_matrix(toas, dt=1, nmin=2)[0], U2[:, 1:2]), msg
+
     def test_psd(self):
         """Test PSD functions."""
         Tmax = self.psr.toas.max() - self.psr.toas.min()